@@ -1,4 +1,5 @@
 from .http_exceptions import *
+from .middleware import *
 from .rest_permissions import *
 from .ui_ordering import *
 from .ui_permissions import *
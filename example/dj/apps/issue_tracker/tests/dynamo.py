@@ -1,5 +1,6 @@
 from germanium.decorators import login
 
+from germanium.test_cases.default import GermaniumTestCase
 from germanium.test_cases.rest import RestTestCase
 from germanium.tools.trivials import assert_in, assert_equal, assert_true, assert_is_not_none
 from germanium.tools.http import (assert_http_bad_request, assert_http_not_found, assert_http_method_not_allowed,
@@ -7,6 +8,8 @@ from germanium.tools.http import (assert_http_bad_request, assert_http_not_found
                                   assert_http_redirect)
 from germanium.tools.rest import assert_valid_JSON_created_response, assert_valid_JSON_response
 
+from is_core.contrib.dynamo.cores import DynamoCore
+
 from .test_case import HelperTestCase, AsSuperuserTestCase
 
 from issue_tracker.dynamo.models import Comment
@@ -73,3 +76,17 @@ class RESTDynamodDBTestCase(AsSuperuserTestCase, HelperTestCase, RestTestCase):
     def test_get_dynamo_comments_without_authorization_should_return_redirect_to_login(self):
         assert_http_redirect(self.get(f'{self.COMMENT_UI_URL.format(0)}0/'))
         assert_http_redirect(self.get(self.COMMENT_UI_URL.format(0)))
+
+
+class DynamoCoreTestCase(GermaniumTestCase):
+
+    def test_dynamo_core_menu_group_should_default_to_model_name(self):
+        class DefaultCommentCore(DynamoCore):
+
+            abstract = True
+            model = Comment
+
+        core = DefaultCommentCore('IS', ())
+        assert_equal(core.menu_group, 'comment')
+        assert_equal(core.get_url_prefix(), 'comment')
+        assert_equal(core.get_menu_group_pattern_name(), 'comment')
@@ -0,0 +1,40 @@
+from django.http import JsonResponse
+from django.test import override_settings
+from django.urls import path
+
+from germanium.test_cases.client import ClientTestCase
+from germanium.tools import assert_equal
+from germanium.tools.http import assert_http_ok, assert_http_not_found
+
+
+__all__ =(
+    'MiddlewareTestCase',
+)
+
+
+def request_kwargs_view(request, **kwargs):
+    return JsonResponse(request.kwargs)
+
+
+def request_kwargs_not_found_view(request, exception):
+    return JsonResponse(request.kwargs, status=404)
+
+
+class RequestKwargsURLConf:
+
+    urlpatterns = [path('request-kwargs/<pk>/', request_kwargs_view)]
+    handler404 = request_kwargs_not_found_view
+
+
+@override_settings(ROOT_URLCONF=RequestKwargsURLConf)
+class MiddlewareTestCase(ClientTestCase):
+
+    def test_request_kwargs_middleware_should_set_resolved_kwargs_to_request(self):
+        resp = self.get('/request-kwargs/5/')
+        assert_http_ok(resp)
+        assert_equal(resp.json(), {'pk': '5'})
+
+    def test_request_kwargs_middleware_should_set_empty_kwargs_to_unresolved_request(self):
+        resp = self.get('/invalid/')
+        assert_http_not_found(resp)
+        assert_equal(resp.json(), {})
@@ -1,7 +1,16 @@
+import gc
+import weakref
+
+from django.contrib.auth.models import User
+from django.test.client import RequestFactory
+from django.views.generic import View
+
 from germanium.test_cases.default import GermaniumTestCase
-from germanium.tools import assert_true, assert_false, assert_equal, assert_not_equal
+from germanium.tools import assert_true, assert_false, assert_equal, assert_not_equal, assert_is_none
 
 from is_core.auth.permissions import BasePermission, PermissionsSet, SelfPermission
+from is_core.generic_views.base import HomeView
+from is_core.main import UiCore
 
 
 __all__ =(
@@ -27,6 +36,29 @@ class ObjIsStringPermission(BasePermission):
         return isinstance(obj, str)
 
 
+class CountingPermission(BasePermission):
+
+    def __init__(self):
+        self.calls = 0
+
+    def has_permission(self, name, request, view, obj=None):
+        self.calls += 1
+        return True
+
+
+class OtherView(View):
+    pass
+
+
+class CountingPermissionCore(UiCore):
+
+    abstract = True
+    menu_group = 'counting-permission'
+    view_classes = (
+        ('list', r'^$', HomeView),
+    )
+
+
 class PermissionsTestCase(GermaniumTestCase):
 
     def test_permissions_should_be_joined_with_operators(self):
@@ -60,3 +92,82 @@ class PermissionsTestCase(GermaniumTestCase):
         assert_true(permission.has_permission('string', None, None, ''))
         assert_true(permission.has_permission('self_note', None, None, None))
         assert_false(permission.has_permission('self_note', None, None, ''))
+
+    def test_permissions_set_should_evaluate_permission_only_once_per_request(self):
+        counting_permission = CountingPermission()
+        permission = PermissionsSet(read=counting_permission)
+        request = RequestFactory().get('/')
+
+        assert_true(permission.has_permission('read', request, View(), None))
+        assert_true(permission.has_permission('read', request, View(), None))
+        assert_equal(counting_permission.calls, 1)
+
+        assert_true(permission.has_permission('read', request, View(), User(pk=1)))
+        assert_true(permission.has_permission('read', request, View(), User(pk=1)))
+        assert_equal(counting_permission.calls, 2)
+
+        assert_true(permission.has_permission('read', request, View(), User(pk=2)))
+        assert_equal(counting_permission.calls, 3)
+
+        assert_true(permission.has_permission('read', request, OtherView(), User(pk=1)))
+        assert_equal(counting_permission.calls, 4)
+
+        assert_true(permission.has_permission('read', request, View(), User()))
+        assert_true(permission.has_permission('read', request, View(), User()))
+        assert_equal(counting_permission.calls, 6)
+
+        request.kwargs = {'pk': '1'}
+        assert_true(permission.has_permission('read', request, View(), None))
+        assert_equal(counting_permission.calls, 7)
+
+        assert_true(permission.has_permission('read', RequestFactory().get('/'), View(), None))
+        assert_equal(counting_permission.calls, 8)
+
+    def test_permissions_set_should_not_memoize_permission_of_unsafe_request(self):
+        counting_permission = CountingPermission()
+        permission = PermissionsSet(read=counting_permission)
+        request = RequestFactory().put('/')
+
+        assert_true(permission.has_permission('read', request, View(), User(pk=1)))
+        assert_true(permission.has_permission('read', request, View(), User(pk=1)))
+        assert_equal(counting_permission.calls, 2)
+
+    def test_pattern_permission_should_be_evaluated_only_once_per_request(self):
+        core = CountingPermissionCore('IS', ())
+        counting_permission = CountingPermission()
+        core.permission.set('read', counting_permission)
+        request = RequestFactory().get('/')
+        request.kwargs = {}
+
+        for _ in range(5):
+            assert_true(core.ui_patterns.get('list').has_permission('get', request))
+        assert_equal(counting_permission.calls, 1)
+
+    def test_permissions_set_cache_should_not_retain_view_and_object(self):
+        permission = PermissionsSet(read=CountingPermission())
+        request = RequestFactory().get('/')
+        view = View()
+        obj = User(pk=1)
+        view_ref = weakref.ref(view)
+        obj_ref = weakref.ref(obj)
+
+        assert_true(permission.has_permission('read', request, view, obj))
+        del view, obj
+        gc.collect()
+        assert_is_none(view_ref())
+        assert_is_none(obj_ref())
+
+    def test_joined_permissions_should_be_flattened(self):
+        obj_is_none = ObjIsNonePermission()
+        obj_is_not_none = ObjIsNotNonePermission()
+        obj_is_string = ObjIsStringPermission()
+
+        and_permission = obj_is_none & obj_is_not_none
+        assert_equal(list(and_permission & obj_is_string), [obj_is_none, obj_is_not_none, obj_is_string])
+        assert_equal(list(obj_is_string & and_permission), [obj_is_string, obj_is_none, obj_is_not_none])
+        assert_equal(list(and_permission), [obj_is_none, obj_is_not_none])
+
+        or_permission = obj_is_none | obj_is_not_none
+        assert_equal(list(or_permission | or_permission), [obj_is_none, obj_is_not_none] * 2)
+        assert_equal(list(or_permission), [obj_is_none, obj_is_not_none])
+        assert_equal(len(list(or_permission & obj_is_string)), 2)
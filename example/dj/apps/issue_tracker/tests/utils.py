@@ -1,12 +1,16 @@
+from django.conf.urls.i18n import i18n_patterns
 from django.contrib.auth.models import User
-from django.test import RequestFactory
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.urls import path
+from django.utils import translation
 
 from germanium.test_cases.default import GermaniumTestCase
 from germanium.tools import assert_equal, assert_raises, assert_is_none
 
 from is_core.utils import (
     get_field_label_from_path, get_field_from_model_or_none, get_field_widget_from_path,
-    get_readonly_field_value_from_path
+    get_readonly_field_value_from_path, reverse_without_kwargs
 )
 from is_core.forms.utils import ReadonlyValue
 from is_core.utils.field_api import (
@@ -29,6 +33,25 @@ __all__ =(
 )
 
 
+def empty_view(request):
+    return HttpResponse()
+
+
+class FirstURLConf:
+
+    urlpatterns = [path('first/', empty_view, name='test-view')]
+
+
+class SecondURLConf:
+
+    urlpatterns = [path('second/', empty_view, name='test-view')]
+
+
+class I18nURLConf:
+
+    urlpatterns = i18n_patterns(path('i18n/', empty_view, name='test-view'))
+
+
 class UtilsTestCase(GermaniumTestCase):
 
     def set_up(self):
@@ -160,3 +183,16 @@ class UtilsTestCase(GermaniumTestCase):
             [solver.first_name, leader.first_name]
         )
         assert_equal(get_readonly_field_value_from_path(issue, 'related_object'), solver, None)
+
+    def test_reverse_without_kwargs_should_respect_root_urlconf(self):
+        with override_settings(ROOT_URLCONF=FirstURLConf):
+            assert_equal(reverse_without_kwargs('test-view'), '/first/')
+        with override_settings(ROOT_URLCONF=SecondURLConf):
+            assert_equal(reverse_without_kwargs('test-view'), '/second/')
+
+    @override_settings(ROOT_URLCONF=I18nURLConf)
+    def test_reverse_without_kwargs_should_respect_active_language(self):
+        with translation.override('en'):
+            assert_equal(reverse_without_kwargs('test-view'), '/en/i18n/')
+        with translation.override('cs'):
+            assert_equal(reverse_without_kwargs('test-view'), '/cs/i18n/')
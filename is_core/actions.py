@@ -1,50 +1,60 @@
 from django.utils.translation import gettext_lazy as _
 
-from pyston.utils import JsonObj
 
+class ActionDict(dict):
+    """
+    Dictionary whose attributes are stored as its items. Instances have no ``__dict__`` thanks to empty slots.
+    """
 
-class Action(JsonObj):
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+    def _update_non_empty(self, **values):
+        self.update({name: value for name, value in values.items() if value})
+
+
+class Action(ActionDict):
+
+    __slots__ = ()
 
     def __init__(self, name, verbose_name, type, class_name=None):
-        super(Action, self).__init__()
-        self.name = name
-        self.verbose_name = verbose_name
-        self.type = type
-        if class_name:
-            self.class_name = class_name
+        super().__init__(name=name, verbose_name=verbose_name, type=type)
+        self._update_non_empty(class_name=class_name)
 
 
 class WebAction(Action):
 
+    __slots__ = ()
+
     def __init__(self, name, verbose_name, class_name=None, target=None, rel=None):
         super().__init__(name, verbose_name, 'web', class_name)
-        if target:
-            self.target = target
-        if rel:
-            self.rel = rel
+        self._update_non_empty(target=target, rel=rel)
 
 
 class RestAction(Action):
 
+    __slots__ = ()
+
     def __init__(self, name, verbose_name, method, data=None, class_name=None, success_text=None, hide_row=None):
         super().__init__(name, verbose_name, 'rest', class_name)
         self.method = method
-        if data:
-            self.data = data
-        if success_text:
-            self.success_text = success_text
-        if hide_row:
-            self.hide_row = hide_row
+        self._update_non_empty(data=data, success_text=success_text, hide_row=hide_row)
 
 
 class ConfirmRestAction(RestAction):
 
+    __slots__ = ()
+
     def __init__(self, name, verbose_name, method, data=None, class_name=None,
                  confirm_dialog=None, success_text=None, hide_row=None):
         super().__init__(name, verbose_name, method, data, class_name, success_text, hide_row)
         self.confirm = confirm_dialog
 
-    class ConfirmDialog(JsonObj):
+    class ConfirmDialog(ActionDict):
+
+        __slots__ = ()
 
         def __init__(self, text, title=None, true_label=None, false_label=None):
             self.true_label = true_label or _('Yes')
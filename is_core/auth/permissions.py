@@ -6,6 +6,8 @@ class BasePermission:
     Base IS core permission object which has only one method has_permission which must be implemented in descendant.
     """
 
+    __slots__ = ()
+
     def has_permission(self, name, request, view, obj=None):
         """
         Checks if request has permission to the given action.
@@ -27,12 +29,12 @@ class BasePermission:
     def __and__(self, other):
         assert isinstance(other, BasePermission), 'Only permission instances can be joined'
 
-        return AndPermission(self, other)
+        return AndPermission.join(self, other)
 
     def __or__(self, other):
         assert isinstance(other, BasePermission), 'Only permission instances can be joined'
 
-        return OrPermission(self, other)
+        return OrPermission.join(self, other)
 
     def __invert__(self):
         return NotPermission(self)
@@ -40,12 +42,27 @@ class BasePermission:
 
 class OperatorPermission(BasePermission):
 
+    __slots__ = ('_permissions',)
+
     operator = None
     operator_function = None
 
     def __init__(self, *permissions):
         self._permissions = list(permissions)
 
+    @classmethod
+    def join(cls, *permissions):
+        """
+        Joins permissions with the operator. Nested permissions with the same operator are flattened to one level.
+        """
+        joined_permissions = []
+        for permission in permissions:
+            if type(permission) is cls:
+                joined_permissions.extend(permission._permissions)
+            else:
+                joined_permissions.append(permission)
+        return cls(*joined_permissions)
+
     def has_permission(self, name, request, view, obj=None):
         return self.operator_function(
             permission.has_permission(name, request, view, obj=obj) for permission in self._permissions
@@ -66,8 +83,7 @@ class OperatorPermission(BasePermission):
         return '({})'.format(' {} '.format(self.operator).join(str(permission) for permission in self._permissions))
 
     def __iter__(self):
-        for permission in self._permissions:
-            yield permission
+        return iter(self._permissions)
 
 
 class AndPermission(OperatorPermission):
@@ -75,14 +91,22 @@ class AndPermission(OperatorPermission):
     Helper for joining permissions with AND operator.
     """
 
+    __slots__ = ()
+
     operator = '&'
     operator_function = all
 
-    def __and__(self, other):
-        assert isinstance(other, BasePermission), 'Only permission instances can be joined'
+    def has_permission(self, name, request, view, obj=None):
+        for permission in self._permissions:
+            if not permission.has_permission(name, request, view, obj=obj):
+                return False
+        return True
 
-        self.add(other)
-        return self
+    def _has_permission_in_permission_set(self, name, request, view, obj=None, parent=None):
+        for permission in self._permissions:
+            if not permission._has_permission_in_permission_set(name, request, view, obj=obj, parent=parent):
+                return False
+        return True
 
 
 class OrPermission(OperatorPermission):
@@ -90,18 +114,28 @@ class OrPermission(OperatorPermission):
     Helper for joining permissions with OR operator.
     """
 
+    __slots__ = ()
+
     operator = '|'
     operator_function = any
 
-    def __or__(self, other):
-        assert isinstance(other, BasePermission), 'Only permission instances can be joined'
+    def has_permission(self, name, request, view, obj=None):
+        for permission in self._permissions:
+            if permission.has_permission(name, request, view, obj=obj):
+                return True
+        return False
 
-        self.add(other)
-        return self
+    def _has_permission_in_permission_set(self, name, request, view, obj=None, parent=None):
+        for permission in self._permissions:
+            if permission._has_permission_in_permission_set(name, request, view, obj=obj, parent=parent):
+                return True
+        return False
 
 
 class NotPermission(BasePermission):
 
+    __slots__ = ('_permission',)
+
     def __init__(self, permission):
         self._permission = permission
 
@@ -114,6 +148,8 @@ class NotPermission(BasePermission):
 
 DEFAULT_PERMISSION = '__default__'
 
+CACHEABLE_REQUEST_METHODS = {'GET', 'HEAD', 'OPTIONS'}
+
 
 class PermissionsSet(BasePermission):
     """
@@ -121,6 +157,8 @@ class PermissionsSet(BasePermission):
     given name grants the access. Finally if no permission with the given name is found ``False`` is returned.
     """
 
+    __slots__ = ('_permissions',)
+
     def __init__(self, **permissions_set):
         """
         Args:
@@ -141,15 +179,49 @@ class PermissionsSet(BasePermission):
         self._permissions[name] = permission
 
     def has_permission(self, name, request, view, obj=None):
-        permission = self._permissions.get(name, self._permissions.get(DEFAULT_PERMISSION, None))
+        """
+        Result of the check is memoized on the request, therefore the same permission is evaluated only once per
+        request for the same view class and core, request kwargs, object and user. Views are not part of the key
+        because patterns create a new view for every check. The object is identified by its class and primary key.
+        Objects can be changed by unsafe requests, therefore checks of these requests are not memoized. Checks of an
+        object without a primary key are not memoized too.
+        """
+        if request is None or request.method not in CACHEABLE_REQUEST_METHODS:
+            return self._has_permission(name, request, view, obj)
+
+        if obj is None:
+            obj_key = None
+        else:
+            obj_pk = getattr(obj, 'pk', None)
+            if obj_pk is None:
+                return self._has_permission(name, request, view, obj)
+            obj_key = (obj.__class__, obj_pk)
+
+        cache = getattr(request, '_is_core_permission_cache', None)
+        if cache is None:
+            cache = request._is_core_permission_cache = {}
+
+        user = getattr(request, 'user', None)
+        key = (
+            self, name, view.__class__, getattr(view, 'core', None),
+            frozenset(getattr(request, 'kwargs', {}).items()), obj_key, user.__class__, getattr(user, 'pk', None)
+        )
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = self._has_permission(name, request, view, obj)
+        return result
+
+    def _has_permission(self, name, request, view, obj=None):
+        permission = self._permissions.get(name)
+        if permission is None:
+            permission = self._permissions.get(DEFAULT_PERMISSION)
         return (
             permission is not None
             and permission._has_permission_in_permission_set(name, request, view, obj=obj, parent=self)
         )
 
     def __iter__(self):
-        for permission in self._permissions.values():
-            yield permission
+        return iter(self._permissions.values())
 
 
 class IsAuthenticated(BasePermission):
@@ -157,8 +229,11 @@ class IsAuthenticated(BasePermission):
     Grant permission if user is authenticated and is active
     """
 
+    __slots__ = ()
+
     def has_permission(self, name, request, view, obj=None):
-        return request.user.is_authenticated and request.user.is_active
+        user = request.user
+        return user.is_authenticated and user.is_active
 
 
 class IsSuperuser(BasePermission):
@@ -166,6 +241,8 @@ class IsSuperuser(BasePermission):
     Grant permission if user is superuser
     """
 
+    __slots__ = ()
+
     def has_permission(self, name, request, view, obj=None):
         return request.user.is_superuser
 
@@ -175,6 +252,8 @@ class IsAdminUser(BasePermission):
     Grant permission if user is staff
     """
 
+    __slots__ = ()
+
     def has_permission(self, name, request, view, obj=None):
         return request.user.is_staff
 
@@ -184,6 +263,8 @@ class AllowAny(BasePermission):
     Grant permission every time
     """
 
+    __slots__ = ()
+
     def has_permission(self, name, request, view, obj=None):
         return True
 
@@ -286,13 +367,11 @@ class FieldsSetPermission(FieldsPermission):
         self.fields_permissions = fields_permissions
 
     def get_disallowed_fields(self, request, view, obj=None):
-        allowed_fields = set()
-        for fields_permission in self.fields_permissions:
-            allowed_fields |= fields_permission.get_disallowed_fields(request, view, obj)
-        return allowed_fields
+        return set().union(*(
+            fields_permission.get_disallowed_fields(request, view, obj) for fields_permission in self.fields_permissions
+        ))
 
     def get_readonly_fields(self, request, view, obj=None):
-        readonly_fields = set()
-        for fields_permission in self.fields_permissions:
-            readonly_fields |= fields_permission.get_readonly_fields(request, view, obj)
-        return readonly_fields
+        return set().union(*(
+            fields_permission.get_readonly_fields(request, view, obj) for fields_permission in self.fields_permissions
+        ))
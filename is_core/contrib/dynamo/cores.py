@@ -1,3 +1,4 @@
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _l
 
 from is_core.main import ModelCore, ModelUiCore, ModelUiRestCore, ModelRestCore
@@ -16,9 +17,9 @@ class DynamoCore(ModelCore):
 
     rest_range_key = None
 
-    @property
+    @cached_property
     def menu_group(self):
-        return self.model.__class__.__name__.lower()
+        return self.model.__name__.lower()
 
     def get_queryset(self, request):
         return self.model.objects.set_hash_key(self._get_hash_key(request))
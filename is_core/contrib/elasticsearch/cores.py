@@ -1,3 +1,5 @@
+from django.utils.functional import cached_property
+
 from is_core.main import ModelCore, ModelUiCore, ModelUiRestCore, ModelRestCore
 
 from .filters import CoreElasticsearchFilterManagerFilterManager
@@ -10,7 +12,7 @@ class ElasticsearchCore(ModelCore):
 
     abstract = True
 
-    @property
+    @cached_property
     def menu_group(self):
         return self.model._index._name.replace('-', '_')
 
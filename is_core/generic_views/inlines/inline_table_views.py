@@ -1,35 +1,59 @@
+from functools import lru_cache
+
 from django.forms.models import _get_foreign_key
+from django.utils.functional import cached_property
 
 from is_core.generic_views.table_views import DjangoTableViewMixin, BaseModelTableViewMixin
 from is_core.generic_views.inlines.base import RelatedInlineView
 
 
+@lru_cache(maxsize=None)
+def _get_foreign_key_name(parent_model, model, fk_name=None):
+    return _get_foreign_key(parent_model, model, fk_name=fk_name).name
+
+
 class BaseModelInlineTableViewMixin:
 
     template_name = 'is_core/forms/inline_table.html'
 
-    def _get_field_labels(self):
+    @cached_property
+    def _field_labels(self):
         return (
             self.field_labels if self.field_labels is not None or not self.related_core
             else self.related_core.get_field_labels(self.request)
         )
 
-    def _get_fields(self):
+    @cached_property
+    def _fields(self):
         return (
             self.related_core.get_list_fields(self.request) if self.related_core and self.fields is None
             else self.fields
         )
 
-    def _get_export_fields(self):
+    @cached_property
+    def _export_fields(self):
         return (
             self.related_core.get_export_fields(self.request) if self.related_core and self.export_fields is None
             else self.export_fields
         )
 
-    def _get_list_per_page(self):
+    @cached_property
+    def _list_per_page(self):
         list_per_page = self.related_core.get_list_per_page(self.request) if self.related_core else None
         return list_per_page if list_per_page is not None else super()._get_list_per_page()
 
+    def _get_field_labels(self):
+        return self._field_labels
+
+    def _get_fields(self):
+        return self._fields
+
+    def _get_export_fields(self):
+        return self._export_fields
+
+    def _get_list_per_page(self):
+        return self._list_per_page
+
     def _get_api_url(self):
         return self.related_core.get_api_url(self.request)
 
@@ -53,7 +77,7 @@ class DjangoInlineTableView(BaseModelInlineTableViewMixin, DjangoTableViewMixin,
 
     def _get_list_filter(self):
         list_filter = super()._get_list_filter()
-        fk_name = _get_foreign_key(self.parent_instance.__class__, self.model, fk_name=self.fk_name).name
+        fk_name = _get_foreign_key_name(self.parent_instance.__class__, self.model, fk_name=self.fk_name)
         list_filter['filter'] = filter = list_filter.get('filter', {})
         if 'filter' in list_filter:
             filter[fk_name] = self.parent_instance.pk
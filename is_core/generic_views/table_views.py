@@ -1,6 +1,8 @@
+from functools import lru_cache
+
 from django import forms
 from django.views.generic.base import TemplateView
-from django.urls import reverse
+from django.utils.functional import cached_property
 
 from is_core.auth.views import FieldPermissionViewMixin
 from is_core.config import settings
@@ -8,7 +10,7 @@ from is_core.generic_views.base import DefaultModelCoreViewMixin
 from is_core.rest.filters import UIFilterMixin, FilterChoiceIterator
 from is_core.rest.datastructures import ModelFlatRestFields, ModelRestFieldset
 from is_core.utils import (
-    pretty_class_name, get_export_types_with_content_type, LOOKUP_SEP, get_field_label_from_path
+    pretty_class_name, get_export_types_with_content_type, LOOKUP_SEP, get_field_label_from_path, reverse_without_kwargs
 )
 
 from chamber.utils.http import query_string_from_dict
@@ -20,6 +22,11 @@ from pyston.order.exceptions import OrderIdentifierError
 from pyston.serializer import get_resource_or_none
 
 
+@lru_cache(maxsize=None)
+def _create_flat_rest_fields(fields, model):
+    return ModelFlatRestFields.create_from_flat_list(fields, model)
+
+
 class Header:
 
     def __init__(self, field_name, text, order_by, filter_html=''):
@@ -68,19 +75,16 @@ class BaseModelTableViewMixin(FieldPermissionViewMixin):
         return self.model_name
 
     def _get_allowed_fields(self):
-        return [
-            field for field in self._get_fields() if field not in self._get_disallowed_fields_from_permissions()
-        ]
+        disallowed_fields = self._get_disallowed_fields_from_permissions()
+        return [field for field in self._get_fields() if field not in disallowed_fields]
 
     def _get_allowed_extra_fields(self):
-        return [
-            field for field in self._get_extra_fields() if field not in self._get_disallowed_fields_from_permissions()
-        ]
+        disallowed_fields = self._get_disallowed_fields_from_permissions()
+        return [field for field in self._get_extra_fields() if field not in disallowed_fields]
 
     def _get_allowed_export_fields(self):
-        return [
-            field for field in self._get_export_fields() if field not in self._get_disallowed_fields_from_permissions()
-        ]
+        disallowed_fields = self._get_disallowed_fields_from_permissions()
+        return [field for field in self._get_export_fields() if field not in disallowed_fields]
 
     def _get_field_filter_widget(self, filter_obj, full_field_name, field):
         return forms.TextInput()
@@ -306,22 +310,42 @@ class BaseModelTableView(DefaultModelCoreViewMixin, BaseModelTableViewMixin, Tem
     def get_add_button_verbose_name(self):
         return self.add_button_verbose_name
 
-    def _get_field_labels(self):
+    @cached_property
+    def _field_labels(self):
         return self.field_labels if self.field_labels is not None else self.core.get_field_labels(self.request)
 
-    def _get_fields(self):
+    @cached_property
+    def _fields(self):
         return self.core.get_list_fields(self.request) if self.fields is None else self.fields
 
-    def _get_export_fields(self):
+    @cached_property
+    def _export_fields(self):
         return self.core.get_export_fields(self.request) if self.export_fields is None else self.export_fields
 
-    def _get_export_types(self):
+    @cached_property
+    def _export_types(self):
         return self.core.get_export_types(self.request) if self.export_types is None else self.export_types
 
-    def _get_list_per_page(self):
+    @cached_property
+    def _list_per_page(self):
         list_per_page = self.core.get_list_per_page(self.request)
         return list_per_page if list_per_page is not None else super()._get_list_per_page()
 
+    def _get_field_labels(self):
+        return self._field_labels
+
+    def _get_fields(self):
+        return self._fields
+
+    def _get_export_fields(self):
+        return self._export_fields
+
+    def _get_export_types(self):
+        return self._export_types
+
+    def _get_list_per_page(self):
+        return self._list_per_page
+
     def _get_api_url(self):
         return self.core.get_api_url(self.request) if self.api_url is None else self.api_url
 
@@ -332,16 +356,19 @@ class BaseModelTableView(DefaultModelCoreViewMixin, BaseModelTableViewMixin, Tem
         return self.core.get_add_url(self.request)
 
     def _generate_rest_export_fieldset(self):
-        return ModelFlatRestFields.create_from_flat_list(
-            list(self._get_allowed_export_fields()), self.model
-        )
+        return _create_flat_rest_fields(tuple(self._get_allowed_export_fields()), self.model)
 
-    def is_bulk_change_enabled(self):
+    @cached_property
+    def _bulk_change_enabled(self):
+        core_is_bulk_change_enabled = getattr(self.core, 'is_bulk_change_enabled', None)
         return (
-            hasattr(self.core, 'is_bulk_change_enabled') and self.core.is_bulk_change_enabled() and
+            core_is_bulk_change_enabled is not None and core_is_bulk_change_enabled() and
             self.core.ui_patterns.get(self.core.get_bulk_change_url_name()).has_permission('get', self.request)
         )
 
+    def is_bulk_change_enabled(self):
+        return self._bulk_change_enabled
+
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
         context_data.update({
@@ -355,10 +382,11 @@ class BaseModelTableView(DefaultModelCoreViewMixin, BaseModelTableViewMixin, Tem
             'bulk_change_snippet_name': self.get_bulk_change_snippet_name(),
             'bulk_change_form_url': self.get_bulk_change_form_url(),
         })
-        if self._get_export_types() and self._get_allowed_export_fields():
+        export_types = self._get_export_types()
+        if export_types and self._get_allowed_export_fields():
             context_data.update({
                 'rest_export_fieldset': self._generate_rest_export_fieldset(),
-                'export_types': get_export_types_with_content_type(self._get_export_types()),
+                'export_types': get_export_types_with_content_type(export_types),
             })
         return context_data
 
@@ -367,7 +395,7 @@ class BaseModelTableView(DefaultModelCoreViewMixin, BaseModelTableViewMixin, Tem
 
     def get_bulk_change_form_url(self):
         return (
-            reverse(''.join(('IS:', self.core.get_bulk_change_url_name(), '-', self.core.menu_group)))
+            reverse_without_kwargs(''.join(('IS:', self.core.get_bulk_change_url_name(), '-', self.core.menu_group)))
             if self.is_bulk_change_enabled() else None
         )
 
@@ -2,12 +2,8 @@
 Core of django-is-core.
 Contains controller added between model and UI/REST.
 """
-import sys
-
 from copy import deepcopy
 
-from collections import OrderedDict
-
 from django.utils.translation import gettext_lazy as _
 from django.utils.functional import cached_property
 from django.urls import reverse
@@ -24,7 +20,7 @@ from is_core.generic_views.table_views import DjangoTableView
 from is_core.rest.resource import DjangoCoreResource
 from is_core.rest.paginators import DjangoOffsetBasedPaginator
 from is_core.patterns import UiPattern, RestPattern, DoubleRestPattern
-from is_core.utils import flatten_fieldsets, GetMethodFieldMixin, get_model_name, PK_PATTERN
+from is_core.utils import flatten_fieldsets, GetMethodFieldMixin, get_model_name, reverse_without_kwargs, PK_PATTERN
 from is_core.menu import LinkMenuItem
 from is_core.loading import register_core
 from is_core.rest.factory import modelrest_factory
@@ -43,11 +39,9 @@ class CoreBase(type):
         abstract = attrs.pop('abstract', False)
         super_new = super(CoreBase, cls).__new__
         new_class = super_new(cls, *args, **kwargs)
-        model_module = sys.modules[new_class.__module__]
-        app_label = model_module.__name__.split('.')[-2]
 
         if name != 'NewBase' and not abstract and new_class.register:
-            register_core(app_label, new_class)
+            register_core(new_class.__module__.rsplit('.', 2)[-2], new_class)
         return new_class
 
 
@@ -99,29 +93,34 @@ class Core(metaclass=CoreBase):
         pass
 
     def get_urlpatterns(self, patterns):
-        urls = []
-        for pattern in patterns.values():
-            url = pattern.get_url()
-            if url:
-                urls.append(url)
-
-        return urls
+        return [url for url in (pattern.get_url() for pattern in patterns.values()) if url]
 
     def get_urls(self):
         return ()
 
-    def get_menu_groups(self):
-        menu_groups = list(self.menu_parent_groups)
+    @cached_property
+    def _menu_groups(self):
         if self.menu_group:
-            menu_groups += (self.menu_group,)
-        return menu_groups
+            return (*self.menu_parent_groups, self.menu_group)
+        return tuple(self.menu_parent_groups)
 
-    def get_url_prefix(self):
+    @cached_property
+    def _url_prefix(self):
         return '/'.join(self.get_menu_groups())
 
-    def get_menu_group_pattern_name(self):
+    @cached_property
+    def _menu_group_pattern_name(self):
         return '-'.join(self.get_menu_groups())
 
+    def get_menu_groups(self):
+        return list(self._menu_groups)
+
+    def get_url_prefix(self):
+        return self._url_prefix
+
+    def get_menu_group_pattern_name(self):
+        return self._menu_group_pattern_name
+
     def get_verbose_name(self):
         return self.verbose_name
 
@@ -257,7 +256,8 @@ class UiCore(Core):
         return self.get_ui_patterns()
 
     def get_ui_patterns(self):
-        ui_patterns = OrderedDict()
+        ui_patterns = {}
+        group_pattern_name = self.get_menu_group_pattern_name()
         for view_class_definition in self.get_view_classes():
             name, view_vals = (view_class_definition[0], view_class_definition[1:])
             if name not in ui_patterns:
@@ -271,9 +271,8 @@ class UiCore(Core):
                     view = getattr(self, view)()
 
                 pattern_names = [name]
-                group_pattern_name = self.get_menu_group_pattern_name()
                 if group_pattern_name:
-                    pattern_names += [self.get_menu_group_pattern_name()]
+                    pattern_names.append(group_pattern_name)
 
                 ui_patterns[name] = ViewPatternClass('-'.join(pattern_names), self.site_name, pattern, view, self)
         return ui_patterns
@@ -319,7 +318,8 @@ class RestCore(Core):
         return self.get_rest_patterns()
 
     def get_rest_patterns(self):
-        rest_patterns = OrderedDict()
+        rest_patterns = {}
+        group_pattern_name = self.get_menu_group_pattern_name()
         for rest_class_definition in self.get_rest_classes():
             name, rest_vals = (rest_class_definition[0], rest_class_definition[1:])
             if name not in rest_patterns:
@@ -333,9 +333,8 @@ class RestCore(Core):
                     rest = getattr(self, rest)()
 
                 pattern_names = [name]
-                group_pattern_name = self.get_menu_group_pattern_name()
                 if group_pattern_name:
-                    pattern_names += [self.get_menu_group_pattern_name()]
+                    pattern_names.append(group_pattern_name)
                 rest_patterns[name] = RestPatternClass('-'.join(pattern_names), self.site_name, pattern, rest, self)
         return rest_patterns
 
@@ -346,7 +345,7 @@ class RestCore(Core):
         return self.api_url_name or '{}:api-{}'.format(self.site_name, self.get_menu_group_pattern_name())
 
     def get_api_url(self, request):
-        return reverse(self.get_api_url_name())
+        return reverse_without_kwargs(self.get_api_url_name())
 
     def get_api_detail_url_name(self):
         return self.api_url_name or '{}:api-resource-{}'.format(self.site_name, self.get_menu_group_pattern_name())
@@ -429,7 +428,9 @@ class ModelUiCore(ModelCore, UiCore):
         return default_model_view_classes
 
     def get_view_classes(self):
-        return super().get_view_classes() + list(self.default_model_view_classes)
+        view_classes = super().get_view_classes()
+        view_classes.extend(self.default_model_view_classes)
+        return view_classes
 
     def get_ui_add_view(self):
         return self.ui_add_view
@@ -455,7 +456,7 @@ class ModelUiCore(ModelCore, UiCore):
 
     def get_show_in_menu(self, request):
         return (
-            self.menu_url_name in self.ui_patterns and self.show_in_menu and
+            self.show_in_menu and self.menu_url_name in self.ui_patterns and
             self.ui_patterns.get(self.menu_url_name).has_permission('get', request)
         )
 
@@ -1,7 +1,7 @@
 from django.http.response import Http404
 from django.core.exceptions import ValidationError
 from django.utils.encoding import force_str
-from django.utils.translation import gettext
+from django.utils.translation import gettext_lazy as _
 from django.urls import resolve, Resolver404
 from django.conf import settings
 
@@ -11,6 +11,9 @@ from is_core.utils.compatibility import MiddlewareMixin
 
 
 def get_request_kwargs(request):
+    """
+    Returns URL kwargs resolved from the request path or an empty dictionary if the path cannot be resolved.
+    """
     try:
         return resolve(request.path).kwargs
     except Resolver404:
@@ -18,18 +21,28 @@ def get_request_kwargs(request):
 
 
 class RequestKwargsMiddleware(MiddlewareMixin):
+    """
+    Sets URL kwargs of the resolved view to the request. Kwargs are taken from the URL resolved by Django handler,
+    therefore request path is not resolved twice. Empty kwargs are set for requests that are not resolved to a view.
+    """
 
     def process_request(self, request):
-        request.kwargs = get_request_kwargs(request)
+        request.kwargs = {}
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.kwargs = dict(view_kwargs)
 
 
 # Not working with pyston exceptions
 class HttpExceptionsMiddleware(MiddlewareMixin):
 
+    validation_error_title = _('Unprocessable Entity')
+    not_found_title = _('Not Found')
+
     def process_exception(self, request, exception):
         if isinstance(exception, ResponseException):
             return exception.get_response(request)
         if isinstance(exception, ValidationError):
-            return response_exception_factory(request, 422, gettext('Unprocessable Entity'), exception.messages)
+            return response_exception_factory(request, 422, self.validation_error_title, exception.messages)
         if not settings.DEBUG and isinstance(exception, Http404):
-            return response_exception_factory(request, 404, gettext('Not Found'), force_str(exception))
+            return response_exception_factory(request, 404, self.not_found_title, force_str(exception))
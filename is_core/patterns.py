@@ -1,11 +1,9 @@
 import logging
 
-from collections import OrderedDict
-
 from django.urls import re_path as url
 from django.urls import reverse, resolve
 
-from is_core.utils import get_new_class_name, PK_PATTERN, NUMBER_PK_PATTERN
+from is_core.utils import get_new_class_name, reverse_without_kwargs, PK_PATTERN, NUMBER_PK_PATTERN
 
 
 logger = logging.getLogger('is-core')
@@ -75,7 +73,7 @@ class ViewPattern(Pattern):
         view_kwargs = {} if view_kwargs is None else view_kwargs
         try_kwargs = self._get_try_kwargs(request, obj)
         try_kwargs.update(view_kwargs)
-        return reverse(self.pattern, kwargs=try_kwargs)
+        return reverse(self.pattern, kwargs=try_kwargs) if try_kwargs else reverse_without_kwargs(self.pattern)
 
     def get_view_dispatch(self):
         raise NotImplementedError
@@ -211,7 +209,7 @@ class DoubleRestPattern:
             detail_resource_methods &= self.methods
             list_resource_methods &= self.methods
 
-        result = OrderedDict()
+        result = {}
         if detail_resource_methods:
             result['api-resource'] = self.pattern_class(
                 'api-resource-{}'.format(self.core.get_menu_group_pattern_name()), self.core.site_name,
@@ -226,8 +224,9 @@ class DoubleRestPattern:
         return result
 
     def _get_list_allowed_methods(self):
+        core_is_bulk_change_enabled = getattr(self.core, 'is_bulk_change_enabled', None)
         return (
             {'get', 'post', 'head', 'options', 'put'}
-            if hasattr(self.core, 'is_bulk_change_enabled') and self.core.is_bulk_change_enabled()
+            if core_is_bulk_change_enabled is not None and core_is_bulk_change_enabled()
             else {'get', 'post', 'head', 'options'}
         )
@@ -5,6 +5,7 @@ from django.http.response import Http404
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext
 from django.utils.encoding import force_str
+from django.utils.functional import cached_property
 from django.urls import NoReverseMatch
 
 from pyston.conf import settings as pyston_settings
@@ -278,14 +279,27 @@ class ModelCoreResourceMixin(FieldPermissionViewMixin, CoreResourceMixin, Permis
     def get_allowed_fields_rfs(self, obj=None):
         return super().get_allowed_fields_rfs().subtract(self._get_disallowed_fields_from_permissions(obj=obj))
 
-    def get_fields(self, obj=None):
+    @cached_property
+    def _rest_fields(self):
         fields = list(self.fields) if self.fields is not None else None
         return self.core.get_rest_fields(self.request, obj=None) if fields is None else fields
 
-    def get_default_fields(self, obj=None):
+    @cached_property
+    def _rest_default_fields(self):
         default_fields = list(self.default_fields) if self.default_fields is not None else None
         return self.core.get_rest_default_fields(self.request, obj=None) if default_fields is None else default_fields
 
+    @cached_property
+    def _rest_extra_fields(self):
+        extra_fields = list(self.extra_fields) if self.extra_fields is not None else None
+        return self.core.get_rest_extra_fields(self.request) if extra_fields is None else extra_fields
+
+    def get_fields(self, obj=None):
+        return self._rest_fields
+
+    def get_default_fields(self, obj=None):
+        return self._rest_default_fields
+
     def get_detailed_fields(self, obj=None):
         detailed_fields = list(self.detailed_fields) if self.detailed_fields is not None else self.get_fields(obj=obj)
         return self.core.get_rest_detailed_fields(self.request, obj=obj) if detailed_fields is None else detailed_fields
@@ -299,8 +313,7 @@ class ModelCoreResourceMixin(FieldPermissionViewMixin, CoreResourceMixin, Permis
         return self.core.get_rest_guest_fields(self.request, obj=obj) if guest_fields is None else guest_fields
 
     def get_extra_fields(self, obj=None):
-        extra_fields = list(self.extra_fields) if self.extra_fields is not None else None
-        return self.core.get_rest_extra_fields(self.request) if extra_fields is None else extra_fields
+        return self._rest_extra_fields
 
     def get_extra_filter_fields(self):
         extra_filter_fields = list(self.extra_filter_fields) if self.extra_filter_fields is not None else None
@@ -3,15 +3,20 @@ import json
 import types
 import datetime
 
+from functools import lru_cache
+
 from django.core.exceptions import ImproperlyConfigured
 from django.contrib.admin.utils import display_for_value as admin_display_for_value
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import QuerySet
 from django.core.exceptions import FieldDoesNotExist
-from django.utils.translation import gettext
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.translation import gettext, get_language
 from django.utils.html import format_html, format_html_join
 from django.utils.formats import get_format, date_format
 from django.utils.timezone import template_localtime
+from django.urls import reverse, get_script_prefix, get_urlconf
 
 from chamber.utils import call_function_with_unknown_input
 
@@ -32,6 +37,25 @@ def is_callable(val):
     return hasattr(val, '__call__')
 
 
+@lru_cache(maxsize=None)
+def _reverse_without_kwargs(viewname, urlconf, script_prefix, language):
+    return reverse(viewname, urlconf=urlconf)
+
+
+@receiver(setting_changed)
+def _clear_reverse_without_kwargs_cache(setting, **kwargs):
+    if setting == 'ROOT_URLCONF':
+        _reverse_without_kwargs.cache_clear()
+
+
+def reverse_without_kwargs(viewname):
+    """
+    Returns URL of the view which has no arguments. The URL is resolved only once for every combination of the URL
+    conf, the script prefix and the active language. The cache is cleared when ROOT_URLCONF setting is changed.
+    """
+    return _reverse_without_kwargs(viewname, get_urlconf(), get_script_prefix(), get_language())
+
+
 def get_new_class_name(prefix, klass):
     prefix = prefix.replace('-', ' ').title()
     prefix = re.sub(r'\s+', '', prefix)
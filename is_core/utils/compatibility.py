@@ -2,13 +2,15 @@ class MiddlewareMixin:
 
     def __init__(self, get_response=None):
         self.get_response = get_response
+        self._process_request = getattr(self, 'process_request', None)
+        self._process_response = getattr(self, 'process_response', None)
         super().__init__()
 
     def __call__(self, request):
         response = None
-        if hasattr(self, 'process_request'):
-            response = self.process_request(request)
+        if self._process_request is not None:
+            response = self._process_request(request)
         response = response or self.get_response(request)
-        if hasattr(self, 'process_response'):
-            response = self.process_response(request, response)
+        if self._process_response is not None:
+            response = self._process_response(request, response)
         return response
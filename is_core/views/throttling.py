@@ -4,5 +4,8 @@ from django.utils.translation import gettext_lazy as _
 from is_core.exceptions.response import response_exception_factory
 
 
+TOO_MANY_REQUESTS_TITLE = _('Too Many Requests')
+
+
 def throttling_failure_view(request, exception):
-    return response_exception_factory(request, 429, _('Too Many Requests'), force_str(exception))
+    return response_exception_factory(request, 429, TOO_MANY_REQUESTS_TITLE, force_str(exception))